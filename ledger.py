@@ -1,12 +1,8 @@
 from datetime import datetime, timezone
 import uuid
 from enum import Enum
-import numpy as np
 import pandas as pd
 
-class Transaction(Enum):
-    CREDIT = 1
-    DEBIT = -1
 class Type(Enum):
     ASSETS = 1
     LIABILITIES = -1
@@ -32,7 +28,7 @@ class Ledger(Header):
         if block.closed == datetime.max:
             raise ValueError("cannot add unclosed block to ledger {}".format(self.id))
 
-        self.journal = pd.concat([self.journal, block], ignore_index=True)
+        self.journal = pd.concat([self.journal, block.journal], ignore_index=True, sort=False)
 
     def net(self) -> None:
         return None
@@ -68,12 +64,8 @@ class Block(Ledger):
     def count(self) -> int:
         return len(self.journal)
     def balance(self) -> float:
-        sum = 0
-        for index, row in self.journal.iterrows():
-            sum += row["Account"].type.value * row["Amount"]
-            print("posting = {} : sum = {}".format(row["Account"], sum))
-
-        return sum
+        signs = self.journal["Account"].map(lambda account: account.type.value)
+        return (signs * self.journal["Amount"]).sum()
     def close(self, overdraft_account=None):
         if not self.single_entry and len(self.journal) == 1:
             raise ValueError("block {} is multi-entry with only one posting".format(self.id))
@@ -84,17 +76,15 @@ class Block(Ledger):
             if overdraft_account == None:
                 overdraft_account = Account(name="OVERDRAFT", type=Type.LIABILITIES)
 
-            if Transaction(overdraft_account.type.value) == Transaction(np.sign(balance)):
-                print("Txn({}) Txn({})".format(overdraft_account.type.value, np.sign(balance)))
-                balance = -1 * balance
-
-            self.post(overdraft_account, balance)
+            # Offset the balance in the overdraft account's own sign convention
+            self.post(overdraft_account, -overdraft_account.type.value * balance)
 
-        print("BALANCE AFTER OVERDRAFT = {}".format(self.balance()))
-        print("PRINTING JOURNAL")
-        print("{} rows".format(self.journal.shape[0]))
-        for index, row in self.journal.iterrows():
-           print("account = {} amount = {}".format(row["Account"], row["Amount"]))
+        # Build the closing report up front and write it in one call
+        report = ["BALANCE AFTER OVERDRAFT = {}".format(self.balance()),
+                  "PRINTING JOURNAL",
+                  "{} rows".format(self.journal.shape[0]),
+                  self.journal.to_string(index=False)]
+        print("\n".join(report))
 
         self.closed = datetime.now(timezone.utc)
 class Account(Block):
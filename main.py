@@ -1,7 +1,4 @@
-import psycopg2
-import pandas as pd
 import argparse
-import schema
 
 parser = argparse.ArgumentParser()
 parser.add_argument('-f', '--filename', type=str, required=True)
@@ -15,6 +12,11 @@ parser.add_argument('-F', '--force', action='store_true')
 parser.add_argument('-K', '--add_keys', action='store_true')
 args = parser.parse_args()
 
+# Import the heavy modules only once the arguments parse, so --help and usage errors return immediately
+import psycopg2
+import pandas as pd
+import schema
+
 data = pd.read_excel(args.filename, sheet_name=None)
 
 
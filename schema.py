@@ -16,11 +16,10 @@ class Database:
 
     """Iterate through each MS Excel sheet to create Table and Column objects"""
     def create(self) -> None:
-        for table_name in self.data:
+        for table_name, df in self.data.items():
             # Store cleaned and original table name in Table
             table = Table(table_name)
-            for col in self.data[table_name].columns:
-                df = self.data[table_name]
+            for col in df.columns:
                 new_column = Column(df[col])
                 table.columns.append(new_column)
 
@@ -38,18 +37,18 @@ class Database:
                     break
             # Check for a multi-column PRIMARY KEY
             if table_name not in self.primary_keys:
-                for i, row in df.iterrows():
-                    if df.duplicated(subset=row.index.tolist()).any():
-                        self.primary_keys[table_name] = row.index.tolist()
-                        break
+                if df.duplicated().any():
+                    self.primary_keys[table_name] = df.columns.tolist()
 
         # Find the FOREIGN KEYS that reference each PRIMARY KEY along with their REFERENCE table
         for primary_key_table, primary_key_column in self.primary_keys.items():
+            # Build the set of PRIMARY KEY values once rather than for every candidate column
+            primary_key_values = set(data_frames[primary_key_table][primary_key_column])
             for foreign_key_table, df in data_frames.items():
                 if foreign_key_table == primary_key_table:
                     continue
                 for column in df.columns:
-                    if set(df[column]).issubset(set(data_frames[primary_key_table][primary_key_column])):
+                    if set(df[column]).issubset(primary_key_values):
                         if foreign_key_table not in self.foreign_keys:
                             self.foreign_keys[foreign_key_table] = []
                         self.foreign_keys[foreign_key_table].append((column, primary_key_table, primary_key_column))
@@ -65,6 +64,7 @@ class Database:
     """Generate CREATE TABLE SQL commands"""
     def createTables(self, cur, conn, force : bool) -> int:
         n_tables = 0
+        queries = []
         for name, table in self.tables.items():
             columns = []
 
@@ -84,7 +84,7 @@ class Database:
                 query = sql.SQL("DROP TABLE IF EXISTS {}").format(
                     sql.Identifier(name)
                 )
-                cur.execute(query)
+                queries.append(query)
 
             column_defs = sql.SQL(', ').join([
                 sql.SQL("{} {}").format(
@@ -122,27 +122,39 @@ class Database:
                 column_defs
             )
 
-            cur.execute(query)
+            queries.append(query)
             n_tables += 1
 
+        # Send all of the DDL in a single round trip
+        if queries:
+            cur.execute(sql.SQL("; ").join(queries))
+
         return n_tables
 
-    """Insert data into corresponding tables"""
-    def insertData(self, cur, data) -> int:
+    """Insert data into corresponding tables, batch_size rows per INSERT"""
+    def insertData(self, cur, data, batch_size : int = 1000) -> int:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1, got {}".format(batch_size))
+
         n_rows = 0
         for table in data:
             column_names = self.tables[table].getColumnNames()
+            rows = list(data[table].itertuples(index=False, name=None))
 
-            for index, row in data[table].iterrows():
-                query = sql.SQL("INSERT INTO {} ({}) VALUES ({})").format(
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start:start + batch_size]
+                query = sql.SQL("INSERT INTO {} ({}) VALUES {}").format(
                     sql.Identifier(table),
                     sql.SQL(', ').join(map(sql.Identifier, column_names)),
-                    sql.SQL(', ').join(map(sql.Literal, row.tolist()))
-
+                    sql.SQL(', ').join([
+                        sql.SQL("({})").format(
+                            sql.SQL(', ').join(map(sql.Literal, row))
+                        ) for row in batch
+                    ])
                 )
 
                 cur.execute(query)
-                n_rows += 1
+                n_rows += len(batch)
 
         return n_rows
 
@@ -163,6 +175,9 @@ class Type(Enum):
     FLOAT = r'^[0-9]+\.[0-9]+$'
     CHAR = ''
 
+# Compile each Type pattern once at import rather than for every Column
+PATTERNS = {member: re.compile(member.value) for member in Type}
+
 class Key(Enum):
     ALTERNATE = "ALTERNATE"
     CANDIDATE = "CANDIDATE"
@@ -179,13 +194,16 @@ class Column:
         self.capacity = 0
         self.buffer = 10
 
+        # Match each distinct string once and weight it by how often it occurs
+        counts = column.map(str).value_counts(dropna=False)
+
         max = 0
         self.type = Type.CHAR
         for member in Type:
 
-            pattern = re.compile(member.value)
+            pattern = PATTERNS[member]
 
-            matches = sum(pattern.match(str(value)) is not None for value in column)
+            matches = sum(count for value, count in counts.items() if pattern.match(value) is not None)
 
             if(matches > max):
                 max = matches
@@ -1,4 +1,5 @@
 from datetime import datetime
+from decimal import Decimal
 
 import pytest
 import ledger
@@ -59,3 +60,44 @@ def test_block_close(setup_block, setup_accounts):
 def test_account():
     account = ledger.Account()
     assert account.single_entry == True
+def test_ledger_post(setup_block, setup_accounts):
+    asset_account, liability_account, income_account, expense_account, equity_account = setup_accounts
+    ledger_ = ledger.Ledger()
+    with pytest.raises(ValueError):
+        ledger_.post(setup_block)
+
+    setup_block.post(liability_account, 100)
+    setup_block.post(asset_account, 100)
+    setup_block.close()
+    ledger_.post(setup_block)
+    assert len(ledger_.journal) == 2
+    assert list(ledger_.journal.columns) == ["Account", "Amount"]
+def test_block_balance(setup_block, setup_accounts):
+    asset_account, liability_account, income_account, expense_account, equity_account = setup_accounts
+    assert setup_block.balance() == 0
+    setup_block.post(liability_account, 100)
+    setup_block.post(asset_account, 1000)
+    assert setup_block.balance() == 900
+    setup_block.close()
+    assert setup_block.balance() == 0
+def test_block_close_negative_balance(setup_block, setup_accounts):
+    asset_account, liability_account, income_account, expense_account, equity_account = setup_accounts
+    setup_block.post(liability_account, 1000)
+    setup_block.post(asset_account, 100)
+    assert setup_block.balance() == -900
+    setup_block.close()
+    assert setup_block.balance() == 0
+
+    block = ledger.Block()
+    block.post(liability_account, 1000)
+    block.post(asset_account, 100)
+    block.close(overdraft_account=asset_account)
+    assert block.balance() == 0
+def test_block_close_decimal(setup_block, setup_accounts):
+    asset_account, liability_account, income_account, expense_account, equity_account = setup_accounts
+    setup_block.post(asset_account, Decimal('0.1'))
+    setup_block.post(asset_account, Decimal('0.2'))
+    setup_block.post(liability_account, Decimal('0.3'))
+    assert setup_block.balance() == Decimal('0.0')
+    setup_block.close()
+    assert setup_block.count() == 3
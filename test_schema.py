@@ -1,5 +1,6 @@
 import pandas as pd
 import pytest
+from psycopg2 import sql
 
 import schema
 
@@ -44,3 +45,83 @@ def test_column(setup):
     assert col.name == 'col4'
     assert col.type == schema.Type.CHAR
     assert col.capacity == 23
+
+def test_column_mixed_types():
+    # Values that compare equal but print differently are matched separately
+    col = schema.Column(pd.Series([True, 1, 1, 1], dtype=object, name='col'))
+    assert col.type == schema.Type.CHAR
+
+    col = schema.Column(pd.Series([1, 1.0, 1.0, 1.0], dtype=object, name='col'))
+    assert col.type == schema.Type.CHAR
+
+def test_find_keys():
+    data = {'country':
+        pd.DataFrame({
+            'code' : ['US', 'FR'],
+            'name' : ['United States', 'France']
+        }),
+
+        'city':
+            pd.DataFrame({
+            'name' : ['Paris', 'Lyon', 'Boston'],
+            'code' : ['FR', 'FR', 'US']
+            })
+    }
+
+    db = schema.Database(data)
+    assert db.findKeys() == 2
+    assert db.primary_keys == {'country': 'code', 'city': 'name'}
+    assert db.foreign_keys == {'city': [('code', 'country', 'code')]}
+
+@pytest.fixture()
+def setup_cursor():
+    class Cursor:
+        def __init__(self):
+            self.queries = []
+        def execute(self, query):
+            self.queries.append(query)
+
+    yield Cursor()
+
+def test_create_tables(setup, setup_cursor):
+    db = schema.Database(setup)
+    db.create()
+    assert db.createTables(setup_cursor, None, True) == 2
+    assert len(setup_cursor.queries) == 1
+
+    statements = [(part.seq[0].string, part.seq[1].strings)
+                  for part in setup_cursor.queries[0].seq if isinstance(part, sql.Composed)]
+    assert statements == [('DROP TABLE IF EXISTS ', ('table1',)),
+                          ('CREATE TABLE ', ('table1',)),
+                          ('DROP TABLE IF EXISTS ', ('table2',)),
+                          ('CREATE TABLE ', ('table2',))]
+
+    # Nothing is sent when there are no tables
+    db = schema.Database({})
+    db.create()
+    setup_cursor.queries.clear()
+    assert db.createTables(setup_cursor, None, True) == 0
+    assert setup_cursor.queries == []
+
+def test_insert_data(setup, setup_cursor):
+    db = schema.Database(setup)
+    db.create()
+    cur = setup_cursor
+    for batch_size in (0, -1):
+        with pytest.raises(ValueError):
+            db.insertData(cur, setup, batch_size=batch_size)
+    assert cur.queries == []
+
+    assert db.insertData(cur, setup, batch_size=3) == 8
+    # 4 rows per table in batches of 3
+    assert len(cur.queries) == 4
+
+    for query, table, start, stop in zip(cur.queries,
+                                         ['table1', 'table1', 'table2', 'table2'],
+                                         [0, 3, 0, 3], [3, 4, 3, 4]):
+        assert query.seq[1] == sql.Identifier(table)
+        # Each VALUES row is SQL('('), the joined literals, SQL(')')
+        rows = [part.seq[1] for part in query.seq[-1].seq if isinstance(part, sql.Composed)]
+        values = [[literal.wrapped for literal in row.seq if isinstance(literal, sql.Literal)]
+                  for row in rows]
+        assert values == setup[table].iloc[start:stop].values.tolist()